@@ -1,16 +1,32 @@
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from ..models.playlist import Playlist
+
+# Buffer size used when opening output files; large exports then need far
+# fewer write() system calls than with the default 8 KiB buffer.
+WRITE_BUFFER_SIZE = 1024 * 1024
 
 
 class BaseExporter(ABC):
     """Abstract base class for data exporters."""
 
     @abstractmethod
-    def export(self, data: Dict[str, Any], file_path: str) -> None:
-        """Export data to a file.
+    def export(self, playlist: Playlist, file_path: str) -> None:
+        """Export a playlist to a file.
         
         Args:
-            data: Dictionary containing playlist data with 'name', 'description', and 'tracks'.
+            playlist: The playlist to export; its tracks are read directly.
             file_path: Path where the file should be written.
         """
         pass
+
+    @staticmethod
+    def _ensure_parent_dir(file_path: str) -> None:
+        """Create the parent directory of file_path if needed.
+        
+        Args:
+            file_path: Path of the file about to be written.
+        """
+        parent = os.path.dirname(file_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
@@ -1,50 +1,60 @@
 import csv
+import io
 import logging
-from pathlib import Path
-from typing import Dict, Any
-from .base_exporter import BaseExporter
+from itertools import islice
+from .base_exporter import BaseExporter, WRITE_BUFFER_SIZE
+from ..models.playlist import Playlist
 
 logger = logging.getLogger(__name__)
 
+_CSV_HEADER = ('Track Title', 'Artist', 'Album', 'Duration (ms)')
+
+# Number of rows formatted before each encode-and-write
+_ROWS_PER_CHUNK = 4096
+
 
 class CSVExporter(BaseExporter):
     """Exports playlist data to CSV format."""
 
-    def export(self, data: Dict[str, Any], file_path: str) -> None:
-        """Export data to a CSV file.
+    def export(self, playlist: Playlist, file_path: str) -> None:
+        """Export a playlist to a CSV file.
         
         Args:
-            data: Dictionary containing playlist data with 'tracks' list.
+            playlist: The playlist to export.
             file_path: Path where the CSV file should be written.
             
         Raises:
-            ValueError: If data structure is invalid.
+            ValueError: If playlist is not a Playlist.
             IOError: If file write fails.
         """
-        if not data or "tracks" not in data:
-            raise ValueError("Data must contain 'tracks' key")
+        if not isinstance(playlist, Playlist):
+            raise ValueError("Data must be a Playlist instance")
         
-        tracks = data.get("tracks", [])
-        if not tracks:
+        if not len(playlist):
             logger.warning("No tracks to export")
         
         try:
-            # Ensure parent directory exists
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent_dir(file_path)
+            
+            # Rows are formatted into an in-memory text buffer and encoded a
+            # chunk at a time, rather than encoding every row separately
+            # through a text-mode file.
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(_CSV_HEADER)
+            rows = playlist.rows()
             
-            with open(file_path, mode='w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow(['Track Title', 'Artist', 'Album', 'Duration (ms)'])
-                
-                for track in tracks:
-                    writer.writerow([
-                        track.get('title', 'Unknown'),
-                        track.get('artist', 'Unknown'),
-                        track.get('album', 'Unknown'),
-                        track.get('duration', 0)
-                    ])
+            with open(file_path, mode='wb', buffering=WRITE_BUFFER_SIZE) as file:
+                while True:
+                    writer.writerows(islice(rows, _ROWS_PER_CHUNK))
+                    chunk = buffer.getvalue()
+                    if not chunk:
+                        break
+                    file.write(chunk.encode('utf-8'))
+                    buffer.seek(0)
+                    buffer.truncate()
             
-            logger.info(f"Successfully exported {len(tracks)} tracks to CSV: {file_path}")
+            logger.info("Successfully exported %d tracks to CSV: %s", len(playlist), file_path)
         except IOError as e:
-            logger.error(f"Failed to write CSV file {file_path}: {e}")
+            logger.error("Failed to write CSV file %s: %s", file_path, e)
             raise
@@ -1,37 +1,69 @@
 import json
 import logging
-from pathlib import Path
-from typing import Dict, Any
-from .base_exporter import BaseExporter
+from typing import Any
+from .base_exporter import BaseExporter, WRITE_BUFFER_SIZE
+from ..models.playlist import Playlist
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to compact UTF-8 encoded JSON bytes.
+    
+    Uses orjson when it is installed and falls back to the standard library;
+    both produce the same bytes.
+    
+    Args:
+        value: The value to serialize.
+        
+    Returns:
+        The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
 class JSONExporter(BaseExporter):
     """Exports playlist data to JSON format."""
 
-    def export(self, data: Dict[str, Any], file_path: str) -> None:
-        """Export data to a JSON file.
+    def export(self, playlist: Playlist, file_path: str) -> None:
+        """Export a playlist to a JSON file.
+        
+        Tracks are encoded one at a time and written straight to the file,
+        so the full serialized document is never held in memory.
         
         Args:
-            data: Dictionary containing playlist data.
+            playlist: The playlist to export.
             file_path: Path where the JSON file should be written.
             
         Raises:
-            ValueError: If data is invalid.
+            ValueError: If playlist is not a Playlist.
             IOError: If file write fails.
         """
-        if not data:
-            raise ValueError("Data cannot be empty")
+        if not isinstance(playlist, Playlist):
+            raise ValueError("Data must be a Playlist instance")
         
         try:
-            # Ensure parent directory exists
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent_dir(file_path)
             
-            with open(file_path, 'w', encoding='utf-8') as json_file:
-                json.dump(data, json_file, indent=4, ensure_ascii=False)
+            with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as json_file:
+                json_file.write(b'{\n  "name": ' + _dumps(playlist.name))
+                json_file.write(b',\n  "description": ' + _dumps(playlist.description))
+                json_file.write(b',\n  "tracks": [')
+                for index, (title, artist, album, duration) in enumerate(playlist.rows()):
+                    json_file.write(b',\n    ' if index else b'\n    ')
+                    json_file.write(_dumps(
+                        {"title": title, "artist": artist, "album": album, "duration": duration}
+                    ))
+                json_file.write(b'\n  ]\n}' if len(playlist) else b']\n}')
             
-            logger.info(f"Successfully exported data to JSON: {file_path}")
+            logger.info("Successfully exported %d tracks to JSON: %s", len(playlist), file_path)
         except IOError as e:
-            logger.error(f"Failed to write JSON file {file_path}: {e}")
+            logger.error("Failed to write JSON file %s: %s", file_path, e)
             raise
@@ -1,52 +1,75 @@
-import xml.etree.ElementTree as ET
 import logging
-from pathlib import Path
-from typing import Dict, Any
-from .base_exporter import BaseExporter
+from typing import Callable, Dict
+from xml.sax.saxutils import escape, quoteattr
+from .base_exporter import BaseExporter, WRITE_BUFFER_SIZE
+from ..models.playlist import Playlist
 
 logger = logging.getLogger(__name__)
 
 
+def _cached_escape() -> Callable[[str], str]:
+    """Create an XML escape function that remembers its results.
+    
+    Artist and album names repeat across many tracks, so each distinct
+    value only needs to be escaped once per export.
+    
+    Returns:
+        Function with the same behaviour as xml.sax.saxutils.escape.
+    """
+    cache: Dict[str, str] = {}
+    
+    def cached(value: str) -> str:
+        try:
+            return cache[value]
+        except KeyError:
+            result = cache[value] = escape(value)
+            return result
+    
+    return cached
+
+
 class XMLExporter(BaseExporter):
     """Exports playlist data to XML format."""
 
-    def export(self, data: Dict[str, Any], file_path: str) -> None:
-        """Export data to an XML file.
+    def export(self, playlist: Playlist, file_path: str) -> None:
+        """Export a playlist to an XML file.
+        
+        The document has a fixed schema, so it is written directly as text
+        rather than built as an element tree and serialized afterwards.
         
         Args:
-            data: Dictionary containing playlist data with 'name', 'description', and 'tracks'.
+            playlist: The playlist to export.
             file_path: Path where the XML file should be written.
             
         Raises:
-            ValueError: If data structure is invalid.
+            ValueError: If playlist is not a Playlist.
             IOError: If file write fails.
         """
-        if not data:
-            raise ValueError("Data cannot be empty")
-        
-        if "tracks" not in data:
-            raise ValueError("Data must contain 'tracks' key")
+        if not isinstance(playlist, Playlist):
+            raise ValueError("Data must be a Playlist instance")
         
         try:
-            # Ensure parent directory exists
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            root = ET.Element("playlist")
-            root.set("name", str(data.get('name', 'Untitled')))
-            root.set("description", str(data.get('description', '')))
-            
-            tracks_element = ET.SubElement(root, "tracks")
-            for track in data.get('tracks', []):
-                track_element = ET.SubElement(tracks_element, "track")
-                ET.SubElement(track_element, "title").text = str(track.get('title', 'Unknown'))
-                ET.SubElement(track_element, "artist").text = str(track.get('artist', 'Unknown'))
-                ET.SubElement(track_element, "album").text = str(track.get('album', 'Unknown'))
-                ET.SubElement(track_element, "duration").text = str(track.get('duration', 0))
+            self._ensure_parent_dir(file_path)
             
-            tree = ET.ElementTree(root)
-            tree.write(file_path, encoding='utf-8', xml_declaration=True)
+            escape_repeated = _cached_escape()
+            with open(file_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as xml_file:
+                xml_file.write("<?xml version='1.0' encoding='utf-8'?>\n")
+                xml_file.write(
+                    f"<playlist name={quoteattr(playlist.name)} "
+                    f"description={quoteattr(playlist.description)}><tracks>"
+                )
+                xml_file.writelines(
+                    f"<track>"
+                    f"<title>{escape(title)}</title>"
+                    f"<artist>{escape_repeated(artist)}</artist>"
+                    f"<album>{escape_repeated(album)}</album>"
+                    f"<duration>{duration}</duration>"
+                    f"</track>"
+                    for title, artist, album, duration in playlist.rows()
+                )
+                xml_file.write("</tracks></playlist>")
             
-            logger.info(f"Successfully exported {len(data.get('tracks', []))} tracks to XML: {file_path}")
+            logger.info("Successfully exported %d tracks to XML: %s", len(playlist), file_path)
         except IOError as e:
-            logger.error(f"Failed to write XML file {file_path}: {e}")
+            logger.error("Failed to write XML file %s: %s", file_path, e)
             raise
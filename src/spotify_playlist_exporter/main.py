@@ -1,11 +1,13 @@
 import logging
 import argparse
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 from .spotify_client import SpotifyClient, SpotifyAuthenticationError, SpotifyAPIError
 from .exporters.json_exporter import JSONExporter
 from .exporters.csv_exporter import CSVExporter
 from .exporters.xml_exporter import XMLExporter
+from .models.playlist import Playlist
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +23,9 @@ EXPORTERS = {
     'xml': XMLExporter,
 }
 
+# Path separators and characters that are invalid in filenames
+_SANITIZE_TABLE = str.maketrans('', '', '/\\<>:"|?*')
+
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename to prevent path traversal and invalid characters.
@@ -31,18 +36,58 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename.
     """
-    # Remove path separators and traversal attempts
-    filename = filename.replace('/', '').replace('\\', '').replace('..', '')
-    # Remove invalid characters but keep basic ones
-    filename = re.sub(r'[<>:"|?*]', '', filename)
+    # Remove path separators and invalid characters, then traversal attempts
+    filename = filename.translate(_SANITIZE_TABLE).replace('..', '')
     # Remove leading/trailing spaces and dots
     filename = filename.strip('. ')
     return filename or 'playlist'
 
 
-def parse_arguments():
+def export_playlist(playlist: Playlist, formats: List[str], output_dir: Path) -> List[Path]:
+    """Export a playlist to one or more formats.
+    
+    The exporters are I/O bound, so when several formats are requested
+    they run concurrently in a thread pool.
+    
+    Args:
+        playlist: The playlist to export.
+        formats: Export format names, keys of EXPORTERS.
+        output_dir: Directory the files are written to.
+        
+    Returns:
+        Paths of the exported files, in the order of formats; empty if no
+        formats are given.
+        
+    Raises:
+        ValueError: If the playlist data is invalid.
+        IOError: If a file write fails.
+    """
+    if not formats:
+        return []
+    
+    safe_name = sanitize_filename(playlist.name)
+    file_names = [output_dir / f"{safe_name}.{fmt}" for fmt in formats]
+    
+    with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+        futures = []
+        for fmt, file_name in zip(formats, file_names):
+            exporter_class = EXPORTERS[fmt]
+            logger.debug("Using %s for export", exporter_class.__name__)
+            logger.info("Exporting playlist to %s format...", fmt.upper())
+            futures.append(executor.submit(exporter_class().export, playlist, str(file_name)))
+        # Re-raise the first failure, if any, in the calling thread
+        for future in futures:
+            future.result()
+    
+    return file_names
+
+
+def parse_arguments(argv: Optional[List[str]] = None):
     """Parse command-line arguments.
     
+    Args:
+        argv: Arguments to parse. If None, uses sys.argv.
+        
     Returns:
         Parsed arguments.
     """
@@ -55,9 +100,10 @@ def parse_arguments():
     )
     parser.add_argument(
         '-f', '--format',
-        default='json',
+        nargs='+',
+        default=['json'],
         choices=list(EXPORTERS.keys()),
-        help='Export format (default: json)'
+        help='One or more export formats (default: json)'
     )
     parser.add_argument(
         '-o', '--output',
@@ -69,7 +115,10 @@ def parse_arguments():
         action='store_true',
         help='Enable verbose logging'
     )
-    return parser.parse_args()
+    args = parser.parse_args(argv)
+    # Drop repeated formats while keeping their order
+    args.format = list(dict.fromkeys(args.format))
+    return args
 
 
 def main():
@@ -92,54 +141,37 @@ def main():
         logger.info("Authentication successful!")
         
         # Retrieve the playlist
-        logger.info(f"Fetching playlist {args.playlist_id}...")
+        logger.info("Fetching playlist %s...", args.playlist_id)
         playlist = client.get_playlist(args.playlist_id)
-        logger.info(f"Successfully fetched playlist: {playlist.name}")
-        
-        # Prepare data for export
-        data = {
-            "name": playlist.name,
-            "description": playlist.description,
-            "tracks": [track.to_dict() for track in playlist.tracks]
-        }
-        
-        # Create exporter instance
-        exporter_class = EXPORTERS[args.format]
-        exporter = exporter_class()
-        logger.debug(f"Using {exporter_class.__name__} for export")
+        logger.info("Successfully fetched playlist: %s", playlist.name)
         
         # Determine output path
         output_dir = Path(args.output)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        safe_name = sanitize_filename(playlist.name)
-        file_name = output_dir / f"{safe_name}.{args.format}"
-        
         # Export the playlist data
-        logger.info(f"Exporting playlist to {args.format.upper()} format...")
-        exporter.export(data, str(file_name))
-        
-        logger.info(f"Playlist successfully exported to {file_name}")
-        print(f"✓ Playlist exported successfully to {file_name}")
+        for file_name in export_playlist(playlist, args.format, output_dir):
+            logger.info("Playlist successfully exported to %s", file_name)
+            print(f"✓ Playlist exported successfully to {file_name}")
         
     except SpotifyAuthenticationError as e:
-        logger.error(f"Authentication error: {e}")
+        logger.error("Authentication error: %s", e)
         print(f"✗ Authentication failed: {e}", flush=True)
         return 1
     except SpotifyAPIError as e:
-        logger.error(f"API error: {e}")
+        logger.error("API error: %s", e)
         print(f"✗ API error: {e}", flush=True)
         return 1
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         print(f"✗ Invalid input: {e}", flush=True)
         return 1
     except IOError as e:
-        logger.error(f"File I/O error: {e}")
+        logger.error("File I/O error: %s", e)
         print(f"✗ File write failed: {e}", flush=True)
         return 1
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         print(f"✗ Unexpected error: {e}", flush=True)
         return 1
     
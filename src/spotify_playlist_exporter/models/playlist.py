@@ -1,9 +1,17 @@
-from typing import List, Dict, Any, Optional
+import sys
+from array import array
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+# Durations are stored in an array('q'), so they must fit a signed 64-bit int
+_MIN_DURATION = -2 ** 63
+_MAX_DURATION = 2 ** 63 - 1
 
 
 class Track:
     """Represents a track in a Spotify playlist."""
 
+    __slots__ = ('title', 'artist', 'album', 'duration')
+
     def __init__(self, title: str, artist: Optional[str], album: Optional[str], duration: int) -> None:
         """Initialize a Track.
         
@@ -11,17 +19,26 @@ class Track:
             title: The track's title.
             artist: The primary artist's name.
             album: The album name.
-            duration: Duration in milliseconds.
+            duration: Duration in milliseconds; converted to an int, with
+                a missing duration stored as 0.
             
         Raises:
-            ValueError: If title is empty.
+            ValueError: If title is empty or duration is not a number that
+                fits in a signed 64-bit integer.
         """
         if not title:
             raise ValueError("Track title cannot be empty")
         self.title = title
-        self.artist = artist or "Unknown Artist"
-        self.album = album or "Unknown Album"
-        self.duration = duration
+        # Artist and album names repeat across tracks; interning keeps a
+        # single copy of each distinct value.
+        self.artist = sys.intern(artist or "Unknown Artist")
+        self.album = sys.intern(album or "Unknown Album")
+        try:
+            self.duration = int(duration or 0)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"Invalid track duration: {duration!r}") from None
+        if not _MIN_DURATION <= self.duration <= _MAX_DURATION:
+            raise ValueError(f"Invalid track duration: {duration!r}")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert track to dictionary.
@@ -38,15 +55,22 @@ class Track:
 
 
 class Playlist:
-    """Represents a Spotify playlist."""
+    """Represents a Spotify playlist.
+    
+    Track fields are stored column-wise in four parallel sequences
+    (``titles``, ``artists``, ``albums`` and ``durations``) so exporters can
+    consume them in bulk without a Python object per track.
+    """
 
-    def __init__(self, name: str, description: Optional[str], tracks: List[Track]) -> None:
+    __slots__ = ('name', 'description', 'titles', 'artists', 'albums', 'durations')
+
+    def __init__(self, name: str, description: Optional[str], tracks: Iterable[Track]) -> None:
         """Initialize a Playlist.
         
         Args:
             name: The playlist's name.
             description: Optional description of the playlist.
-            tracks: List of Track objects.
+            tracks: Track objects; any iterable, consumed once.
             
         Raises:
             ValueError: If name is empty.
@@ -55,7 +79,44 @@ class Playlist:
             raise ValueError("Playlist name cannot be empty")
         self.name = name
         self.description = description or ""
-        self.tracks = tracks or []
+        self.titles: List[str] = []
+        self.artists: List[str] = []
+        self.albums: List[str] = []
+        self.durations = array('q')
+        for track in tracks or []:
+            self.add_track(track)
+
+    def __len__(self) -> int:
+        """Return the number of tracks in the playlist."""
+        return len(self.titles)
+
+    def add_track(self, track: Track) -> None:
+        """Append a track to the playlist.
+        
+        Args:
+            track: The Track to append.
+        """
+        self.titles.append(track.title)
+        self.artists.append(track.artist)
+        self.albums.append(track.album)
+        self.durations.append(track.duration)
+
+    def rows(self) -> Iterator[Tuple[str, str, str, int]]:
+        """Iterate over tracks as (title, artist, album, duration) tuples.
+        
+        Returns:
+            Iterator zipping the track columns.
+        """
+        return zip(self.titles, self.artists, self.albums, self.durations)
+
+    @property
+    def tracks(self) -> List[Track]:
+        """Track objects rebuilt from the column storage.
+        
+        A new list is built on every access, so appending to it does not
+        modify the playlist; use add_track() instead.
+        """
+        return [Track(*row) for row in self.rows()]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert playlist to dictionary.
@@ -66,5 +127,8 @@ class Playlist:
         return {
             "name": self.name,
             "description": self.description,
-            "tracks": [track.to_dict() for track in self.tracks]
+            "tracks": [
+                {"title": title, "artist": artist, "album": album, "duration": duration}
+                for title, artist, album, duration in self.rows()
+            ]
         }
@@ -1,13 +1,26 @@
 import requests
 import os
 import logging
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
 from dotenv import load_dotenv
 from .models.playlist import Playlist, Track
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Largest page size the playlist tracks endpoint accepts
+TRACKS_PAGE_LIMIT = 100
+# Only request the track fields that are mapped onto Track
+_TRACK_FIELDS = "items(track(name,artists(name),album(name),duration_ms)),next,total"
+# Maximum number of track pages requested at the same time
+MAX_CONCURRENT_REQUESTS = 4
+# Number of fetched playlists each client keeps in memory
+PLAYLIST_CACHE_SIZE = 128
+
 
 class SpotifyAuthenticationError(Exception):
     """Raised when Spotify authentication fails."""
@@ -19,16 +32,73 @@ class SpotifyAPIError(Exception):
     pass
 
 
+class RateLimiter:
+    """Token bucket that spaces out API requests.
+    
+    Up to ``capacity`` requests go through immediately; after that, callers
+    are delayed so the long-run rate stays at ``rate`` requests per second.
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        capacity: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens the bucket holds.
+            clock: Monotonic time source, in seconds.
+            sleep: Function used to wait for a token.
+            
+        Raises:
+            ValueError: If rate or capacity is not positive.
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("Rate limiter rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available if necessary."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # A negative balance reserves tokens for callers already waiting
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            logger.debug("Rate limit reached, waiting %.3fs", wait)
+            self._sleep(wait)
+
+
 class SpotifyClient:
     """Client for interacting with the Spotify API."""
 
-    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
         """Initialize SpotifyClient with credentials.
         
         Args:
             client_id: Spotify API client ID. If None, uses SPOTIFY_CLIENT_ID env var.
             client_secret: Spotify API client secret. If None, uses SPOTIFY_CLIENT_SECRET env var.
-
+            rate_limiter: Limiter applied to API requests. If None, allows
+                10 requests per second with bursts of 10.
             
         Raises:
             ValueError: If required credentials are missing.
@@ -41,8 +111,14 @@ class SpotifyClient:
         
         self.access_token: Optional[str] = None
         self.base_url = "https://api.spotify.com/v1"
+        self._playlist_cache: "OrderedDict[str, Playlist]" = OrderedDict()
+        self.rate_limiter = rate_limiter or RateLimiter()
         logger.info("SpotifyClient initialized")
 
+    def clear_cache(self) -> None:
+        """Discard all cached playlists."""
+        self._playlist_cache.clear()
+
     def authenticate(self) -> bool:
         """Authenticate with Spotify API using Client Credentials flow.
         
@@ -69,10 +145,10 @@ class SpotifyClient:
                 logger.error("Authentication failed: Invalid credentials")
                 raise SpotifyAuthenticationError("Invalid Spotify credentials")
             else:
-                logger.error(f"Authentication failed with status {response.status_code}")
+                logger.error("Authentication failed with status %s", response.status_code)
                 raise SpotifyAuthenticationError(f"Authentication failed: {response.status_code}")
         except requests.exceptions.RequestException as e:
-            logger.error(f"Network error during authentication: {e}")
+            logger.error("Network error during authentication: %s", e)
             raise SpotifyAuthenticationError(f"Network error during authentication: {e}")
 
     def _validate_playlist_id(self, playlist_id: str) -> None:
@@ -101,6 +177,13 @@ class SpotifyClient:
     def get_playlist(self, playlist_id: str) -> Playlist:
         """Fetch playlist data from Spotify API.
         
+        Fetched playlists are cached per client (least recently used first
+        out), so repeated calls for the same ID return the same Playlist
+        without further requests. The returned object is the cached instance
+        and is shared by every caller: do not modify it (e.g. with
+        add_track()). Cached entries never expire, so changes made to the
+        playlist on Spotify are not seen until clear_cache() is called.
+        
         Args:
             playlist_id: The Spotify playlist ID.
             
@@ -114,34 +197,47 @@ class SpotifyClient:
         """
         self._validate_playlist_id(playlist_id)
         
+        cached = self._playlist_cache.get(playlist_id)
+        if cached is not None:
+            self._playlist_cache.move_to_end(playlist_id)
+            logger.debug("Using cached playlist: %s", playlist_id)
+            return cached
+        
         if not self.access_token:
             self.authenticate()
         
         url = f"{self.base_url}/playlists/{playlist_id}"
         
         try:
+            self.rate_limiter.acquire()
             response = requests.get(url, headers=self._get_headers(), timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
-                logger.info(f"Successfully fetched playlist: {playlist_id}")
-                tracks = self.get_tracks(playlist_id)
-                return Playlist(
+                logger.info("Successfully fetched playlist: %s", playlist_id)
+                # Tracks go straight from each response page into the
+                # playlist's columns without an intermediate list.
+                playlist = Playlist(
                     name=data.get("name", "Untitled"),
                     description=data.get("description"),
-                    tracks=tracks
+                    tracks=self._iter_tracks(playlist_id)
                 )
+                logger.info("Successfully fetched %d tracks from playlist %s", len(playlist), playlist_id)
+                self._playlist_cache[playlist_id] = playlist
+                if len(self._playlist_cache) > PLAYLIST_CACHE_SIZE:
+                    self._playlist_cache.popitem(last=False)
+                return playlist
             elif response.status_code == 404:
-                logger.error(f"Playlist not found: {playlist_id}")
+                logger.error("Playlist not found: %s", playlist_id)
                 raise SpotifyAPIError(f"Playlist not found: {playlist_id}")
             elif response.status_code == 401:
                 logger.error("Unauthorized: Invalid or expired token")
                 raise SpotifyAuthenticationError("Invalid or expired authentication token")
             else:
-                logger.error(f"Failed to fetch playlist: {response.status_code}")
+                logger.error("Failed to fetch playlist: %s", response.status_code)
                 raise SpotifyAPIError(f"Failed to fetch playlist: {response.status_code}")
         except requests.exceptions.RequestException as e:
-            logger.error(f"Network error fetching playlist: {e}")
+            logger.error("Network error fetching playlist: %s", e)
             raise SpotifyAPIError(f"Network error fetching playlist: {e}")
 
     def get_tracks(self, playlist_id: str) -> List[Track]:
@@ -163,37 +259,97 @@ class SpotifyClient:
         if not self.access_token:
             self.authenticate()
         
-        tracks: List[Track] = []
+        tracks = list(self._iter_tracks(playlist_id))
+        logger.info("Successfully fetched %d tracks from playlist %s", len(tracks), playlist_id)
+        return tracks
+
+    def _fetch_tracks_page(self, url: str, params: Optional[dict] = None) -> dict:
+        """Fetch one page of playlist tracks.
+        
+        Args:
+            url: Tracks endpoint or a "next" link returned by the API.
+            params: Query parameters to add to the URL.
+            
+        Returns:
+            The decoded JSON page.
+            
+        Raises:
+            SpotifyAPIError: If the API responds with an error status.
+            requests.exceptions.RequestException: On network errors.
+        """
+        self.rate_limiter.acquire()
+        response = requests.get(url, headers=self._get_headers(), params=params, timeout=10)
+        if response.status_code != 200:
+            logger.error("Failed to fetch tracks: %s", response.status_code)
+            raise SpotifyAPIError(f"Failed to fetch tracks: {response.status_code}")
+        return response.json()
+
+    @staticmethod
+    def _parse_tracks(data: dict) -> Iterator[Track]:
+        """Yield the valid tracks from one page of playlist items.
+        
+        Args:
+            data: A decoded tracks page.
+            
+        Yields:
+            Track objects; invalid track entries are skipped.
+        """
+        for item in data.get("items", []):
+            track_data = item.get("track")
+            if track_data:
+                try:
+                    yield Track(
+                        title=track_data.get("name", "Unknown Track"),
+                        artist=track_data.get("artists", [{}])[0].get("name"),
+                        album=track_data.get("album", {}).get("name"),
+                        duration=track_data.get("duration_ms", 0)
+                    )
+                except ValueError as e:
+                    logger.warning("Skipping invalid track: %s", e)
+
+    def _iter_tracks(self, playlist_id: str) -> Iterator[Track]:
+        """Yield tracks from a playlist in playlist order.
+        
+        When the first page reports the playlist's total track count, the
+        remaining pages are requested concurrently by offset; otherwise the
+        "next" links are followed one page at a time. Tracks are yielded as
+        each page is parsed, so callers can consume them without building an
+        intermediate list.
+        
+        Args:
+            playlist_id: The Spotify playlist ID.
+            
+        Yields:
+            Track objects; invalid track entries are skipped.
+            
+        Raises:
+            SpotifyAPIError: If API request fails.
+        """
         url = f"{self.base_url}/playlists/{playlist_id}/tracks"
         
+        def fetch_offset(offset: int) -> dict:
+            return self._fetch_tracks_page(
+                url, {"limit": TRACKS_PAGE_LIMIT, "offset": offset, "fields": _TRACK_FIELDS}
+            )
+        
         try:
-            while url:
-                response = requests.get(url, headers=self._get_headers(), timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    for item in data.get("items", []):
-                        track_data = item.get("track")
-                        if track_data:
-                            try:
-                                tracks.append(Track(
-                                    title=track_data.get("name", "Unknown Track"),
-                                    artist=track_data.get("artists", [{}])[0].get("name"),
-                                    album=track_data.get("album", {}).get("name"),
-                                    duration=track_data.get("duration_ms", 0)
-                                ))
-                            except ValueError as e:
-                                logger.warning(f"Skipping invalid track: {e}")
-                                continue
-                    
-                    url = data.get("next")
-                    logger.debug(f"Fetched batch of tracks. Total so far: {len(tracks)}")
-                else:
-                    logger.error(f"Failed to fetch tracks: {response.status_code}")
-                    raise SpotifyAPIError(f"Failed to fetch tracks: {response.status_code}")
+            data = fetch_offset(0)
+            total = data.get("total")
+            if isinstance(total, int) and total > TRACKS_PAGE_LIMIT:
+                offsets = range(TRACKS_PAGE_LIMIT, total, TRACKS_PAGE_LIMIT)
+                with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                    # map() yields pages in offset order regardless of completion order
+                    pages = executor.map(fetch_offset, offsets)
+                    yield from self._parse_tracks(data)
+                    for page in pages:
+                        yield from self._parse_tracks(page)
+                logger.debug("Fetched %d track pages concurrently", len(offsets) + 1)
+            else:
+                yield from self._parse_tracks(data)
+                # The "next" links returned by the API already carry the query parameters
+                while data.get("next"):
+                    data = self._fetch_tracks_page(data["next"])
+                    yield from self._parse_tracks(data)
         except requests.exceptions.RequestException as e:
-            logger.error(f"Network error fetching tracks: {e}")
+            logger.error("Network error fetching tracks: %s", e)
             raise SpotifyAPIError(f"Network error fetching tracks: {e}")
-        
-        logger.info(f"Successfully fetched {len(tracks)} tracks from playlist {playlist_id}")
-        return tracks
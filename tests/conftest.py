@@ -0,0 +1,87 @@
+"""Shared fixtures for the test suite."""
+
+import json
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+from spotify_playlist_exporter.spotify_client import RateLimiter, SpotifyClient
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+TOKEN_URL = "https://accounts.spotify.com/api/token"
+PLAYLIST_URL = "https://api.spotify.com/v1/playlists/playlist123"
+TRACKS_URL = "https://api.spotify.com/v1/playlists/playlist123/tracks"
+
+
+def load_fixture(name):
+    """Load a JSON payload from the fixtures directory."""
+    return json.loads((FIXTURES_DIR / name).read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def track_page():
+    """Single page of playlist tracks as returned by the Spotify API.
+
+    Shared across the session; tests must not mutate it.
+    """
+    return load_fixture("track_page.json")
+
+
+@pytest.fixture(scope="session")
+def playlist_meta():
+    """Playlist metadata as returned by the Spotify API.
+
+    Shared across the session; tests must not mutate it.
+    """
+    return load_fixture("playlist_meta.json")
+
+
+@pytest.fixture
+def spotify_api(requests_mock, playlist_meta, track_page):
+    """Mocked Spotify API serving the token, playlist123 and its tracks.
+
+    Tests override individual endpoints by registering them again, e.g.
+    ``spotify_api.get(url, status_code=404)``.
+    """
+    requests_mock.post(TOKEN_URL, json={"access_token": "test_token", "expires_in": 3600})
+    requests_mock.get(PLAYLIST_URL, json=playlist_meta)
+    requests_mock.get(TRACKS_URL, json=track_page)
+    return requests_mock
+
+
+def reset_client_state(client):
+    """Clear per-test state (cache and rate limiter) on a shared client."""
+    client.clear_cache()
+    client.rate_limiter = RateLimiter()
+
+
+@pytest.fixture(scope="module")
+def shared_spotify_client():
+    """SpotifyClient constructed once per test module."""
+    return SpotifyClient(client_id="test_id", client_secret="test_secret")
+
+
+@pytest.fixture
+def spotify_client(shared_spotify_client):
+    """Shared, unauthenticated SpotifyClient with its per-test state reset."""
+    shared_spotify_client.access_token = None
+    reset_client_state(shared_spotify_client)
+    return shared_spotify_client
+
+
+@pytest.fixture(scope="session")
+def shared_authenticated_client():
+    """SpotifyClient authenticated once per session against a mocked token endpoint."""
+    client = SpotifyClient(client_id="test_id", client_secret="test_secret")
+    with requests_mock.Mocker() as mocker:
+        mocker.post(TOKEN_URL, json={"access_token": "test_token", "expires_in": 3600})
+        client.authenticate()
+    return client
+
+
+@pytest.fixture
+def authenticated_client(shared_authenticated_client):
+    """Shared, authenticated SpotifyClient with its per-test state reset."""
+    reset_client_state(shared_authenticated_client)
+    return shared_authenticated_client
@@ -1,10 +1,14 @@
 """Tests for exporter classes."""
 
+import csv
 import json
+import shutil
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
 import pytest
 
+from spotify_playlist_exporter.exporters import json_exporter
 from spotify_playlist_exporter.exporters.csv_exporter import CSVExporter
 from spotify_playlist_exporter.exporters.json_exporter import JSONExporter
 from spotify_playlist_exporter.exporters.xml_exporter import XMLExporter
@@ -30,16 +34,6 @@ def sample_playlist(sample_tracks):
     )
 
 
-@pytest.fixture
-def sample_data(sample_playlist):
-    """Fixture providing sample data dictionary."""
-    return {
-        "name": sample_playlist.name,
-        "description": sample_playlist.description,
-        "tracks": [track.to_dict() for track in sample_playlist.tracks],
-    }
-
-
 class TestJSONExporter:
     """Tests for JSONExporter."""
 
@@ -48,12 +42,12 @@ class TestJSONExporter:
         exporter = JSONExporter()
         assert isinstance(exporter, JSONExporter)
 
-    def test_export_creates_file(self, tmp_path, sample_data):
+    def test_export_creates_file(self, tmp_path, sample_playlist):
         """Export should create a JSON file with correct content."""
         exporter = JSONExporter()
         file_path = tmp_path / "playlist.json"
 
-        exporter.export(sample_data, str(file_path))
+        exporter.export(sample_playlist, str(file_path))
 
         assert file_path.exists()
         with open(file_path) as f:
@@ -63,23 +57,49 @@ class TestJSONExporter:
         assert exported_data["description"] == "A playlist for testing"
         assert len(exported_data["tracks"]) == 2
 
-    def test_export_creates_nested_directories(self, tmp_path, sample_data):
+    def test_export_creates_nested_directories(self, tmp_path, sample_playlist):
         """Export should create missing parent directories."""
         exporter = JSONExporter()
         file_path = tmp_path / "nested" / "dirs" / "playlist.json"
 
-        exporter.export(sample_data, str(file_path))
+        exporter.export(sample_playlist, str(file_path))
 
         assert file_path.exists()
         assert file_path.parent.exists()
 
-    @pytest.mark.parametrize("data", [{}, None])
-    def test_export_with_empty_data_raises_error(self, tmp_path, data):
-        """Export should raise ValueError for empty data."""
+    def test_export_preserves_unicode(self, tmp_path):
+        """Export should write non-ASCII characters unescaped as UTF-8."""
+        exporter = JSONExporter()
+        file_path = tmp_path / "playlist.json"
+        playlist = Playlist(name="Café del Mar", description="", tracks=[])
+
+        exporter.export(playlist, str(file_path))
+
+        content = file_path.read_text(encoding="utf-8")
+        assert "Café del Mar" in content
+        assert json.loads(content) == playlist.to_dict()
+
+    def test_export_without_orjson(self, tmp_path, sample_playlist, monkeypatch):
+        """The standard library fallback should write the same bytes as orjson."""
+        pytest.importorskip("orjson")
+        orjson_path = tmp_path / "orjson.json"
+        fallback_path = tmp_path / "fallback.json"
+        sample_playlist.add_track(Track(title="Café", artist="Björk", album="Album", duration=1))
+
+        JSONExporter().export(sample_playlist, str(orjson_path))
+        monkeypatch.setattr(json_exporter, "orjson", None)
+        JSONExporter().export(sample_playlist, str(fallback_path))
+
+        assert fallback_path.read_bytes() == orjson_path.read_bytes()
+        assert json.loads(fallback_path.read_bytes()) == sample_playlist.to_dict()
+
+    @pytest.mark.parametrize("data", [{}, None, {"name": "Test", "tracks": []}])
+    def test_export_with_non_playlist_data_raises_error(self, tmp_path, data):
+        """Export should raise ValueError for anything other than a Playlist."""
         exporter = JSONExporter()
         file_path = tmp_path / "test.json"
 
-        with pytest.raises(ValueError, match="Data cannot be empty"):
+        with pytest.raises(ValueError, match="Playlist instance"):
             exporter.export(data, str(file_path))
 
 
@@ -91,12 +111,12 @@ class TestCSVExporter:
         exporter = CSVExporter()
         assert isinstance(exporter, CSVExporter)
 
-    def test_export_creates_file_with_header(self, tmp_path, sample_data):
+    def test_export_creates_file_with_header(self, tmp_path, sample_playlist):
         """Export should create a CSV file with header and data."""
         exporter = CSVExporter()
         file_path = tmp_path / "playlist.csv"
 
-        exporter.export(sample_data, str(file_path))
+        exporter.export(sample_playlist, str(file_path))
 
         assert file_path.exists()
         with open(file_path, encoding="utf-8") as f:
@@ -107,22 +127,40 @@ class TestCSVExporter:
         assert "Song 1" in lines[1]
         assert "Song 2" in lines[2]
 
-    def test_export_without_tracks_key_raises_error(self, tmp_path):
-        """Export should raise ValueError if 'tracks' key is missing."""
+    def test_export_quotes_and_encodes_fields(self, tmp_path):
+        """Export should quote special characters and write UTF-8 across chunks."""
+        exporter = CSVExporter()
+        file_path = tmp_path / "playlist.csv"
+        tracks = [
+            Track(title=f'Café, "No. {i}"', artist="Artist\nName", album="Album", duration=i)
+            for i in range(5000)
+        ]
+        playlist = Playlist(name="Big", description=None, tracks=tracks)
+
+        exporter.export(playlist, str(file_path))
+
+        with open(file_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 5001
+        assert rows[1] == ['Café, "No. 0"', "Artist\nName", "Album", "0"]
+        assert rows[-1][3] == "4999"
+
+    def test_export_with_dict_data_raises_error(self, tmp_path):
+        """Export should raise ValueError if given a dict instead of a Playlist."""
         exporter = CSVExporter()
         file_path = tmp_path / "test.csv"
-        data = {"name": "Test", "description": "Test"}
+        data = {"name": "Test", "description": "Test", "tracks": []}
 
-        with pytest.raises(ValueError, match="'tracks' key"):
+        with pytest.raises(ValueError, match="Playlist instance"):
             exporter.export(data, str(file_path))
 
     def test_export_with_empty_tracks(self, tmp_path):
         """Export should succeed with empty tracks list."""
         exporter = CSVExporter()
         file_path = tmp_path / "test.csv"
-        data = {"name": "Empty", "description": "No tracks", "tracks": []}
+        playlist = Playlist(name="Empty", description="No tracks", tracks=[])
 
-        exporter.export(data, str(file_path))
+        exporter.export(playlist, str(file_path))
 
         assert file_path.exists()
 
@@ -135,12 +173,12 @@ class TestXMLExporter:
         exporter = XMLExporter()
         assert isinstance(exporter, XMLExporter)
 
-    def test_export_creates_valid_xml_file(self, tmp_path, sample_data):
+    def test_export_creates_valid_xml_file(self, tmp_path, sample_playlist):
         """Export should create a valid XML file with correct content."""
         exporter = XMLExporter()
         file_path = tmp_path / "playlist.xml"
 
-        exporter.export(sample_data, str(file_path))
+        exporter.export(sample_playlist, str(file_path))
 
         assert file_path.exists()
         with open(file_path, encoding="utf-8") as f:
@@ -150,35 +188,41 @@ class TestXMLExporter:
         assert "Test Playlist" in content
         assert "Song 1" in content
 
-    def test_export_without_tracks_key_raises_error(self, tmp_path):
-        """Export should raise ValueError if 'tracks' key is missing."""
+    def test_export_with_dict_data_raises_error(self, tmp_path):
+        """Export should raise ValueError if given a dict instead of a Playlist."""
         exporter = XMLExporter()
         file_path = tmp_path / "test.xml"
-        data = {"name": "Test"}
+        data = {"name": "Test", "tracks": []}
 
-        with pytest.raises(ValueError, match="'tracks' key"):
+        with pytest.raises(ValueError, match="Playlist instance"):
             exporter.export(data, str(file_path))
 
     def test_export_with_special_characters(self, tmp_path):
         """Export should handle special characters correctly."""
         exporter = XMLExporter()
         file_path = tmp_path / "test.xml"
-        data = {
-            "name": "Test & Special <Chars>",
-            "description": 'Description with "quotes"',
-            "tracks": [
-                {
-                    "title": "Song with & chars",
-                    "artist": "Artist <name>",
-                    "album": "Album",
-                    "duration": 180000,
-                }
+        playlist = Playlist(
+            name="Test & Special <Chars>",
+            description='Description with "quotes"',
+            tracks=[
+                Track(
+                    title="Song with & chars",
+                    artist="Artist <name>",
+                    album="Album",
+                    duration=180000,
+                )
             ],
-        }
+        )
 
-        exporter.export(data, str(file_path))
+        exporter.export(playlist, str(file_path))
 
-        assert file_path.exists()
+        root = ET.parse(file_path).getroot()
+        assert root.get("name") == "Test & Special <Chars>"
+        assert root.get("description") == 'Description with "quotes"'
+        track = root.find("tracks/track")
+        assert track.findtext("title") == "Song with & chars"
+        assert track.findtext("artist") == "Artist <name>"
+        assert track.findtext("duration") == "180000"
 
 
 class TestExporterIntegration:
@@ -192,12 +236,24 @@ class TestExporterIntegration:
             (XMLExporter, "xml"),
         ],
     )
-    def test_export_all_formats(self, tmp_path, sample_data, exporter_class, extension):
+    def test_export_all_formats(self, tmp_path, sample_playlist, exporter_class, extension):
         """All exporters should create files with correct extensions."""
         exporter = exporter_class()
         file_path = tmp_path / f"playlist.{extension}"
 
-        exporter.export(sample_data, str(file_path))
+        exporter.export(sample_playlist, str(file_path))
 
         assert file_path.exists()
         assert file_path.suffix == f".{extension}"
+
+    @pytest.mark.parametrize("exporter_class", [JSONExporter, CSVExporter, XMLExporter])
+    def test_export_recreates_deleted_directory(self, tmp_path, sample_playlist, exporter_class):
+        """Exporting again after the output directory was removed should recreate it."""
+        file_path = tmp_path / "out" / "playlist.out"
+        exporter = exporter_class()
+
+        exporter.export(sample_playlist, str(file_path))
+        shutil.rmtree(file_path.parent)
+        exporter.export(sample_playlist, str(file_path))
+
+        assert file_path.exists()
@@ -0,0 +1,64 @@
+"""Tests for the command-line entry point."""
+
+import pytest
+
+from spotify_playlist_exporter.main import export_playlist, parse_arguments, sanitize_filename
+from spotify_playlist_exporter.models.playlist import Playlist, Track
+
+
+class TestSanitizeFilename:
+    """Tests for sanitize_filename."""
+
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
+            ("My Playlist", "My Playlist"),
+            ("../../etc/passwd", "etcpasswd"),
+            ("back\\slash", "backslash"),
+            ('a<b>c:d"e|f?g*h', "abcdefgh"),
+            (" .hidden. ", "hidden"),
+            ("..", "playlist"),
+            ("", "playlist"),
+        ],
+    )
+    def test_sanitize_filename(self, filename, expected):
+        """sanitize_filename should strip path separators and invalid characters."""
+        assert sanitize_filename(filename) == expected
+
+
+class TestParseArguments:
+    """Tests for parse_arguments."""
+
+    def test_default_format(self):
+        """Format should default to JSON only."""
+        args = parse_arguments(["playlist123"])
+        assert args.format == ["json"]
+
+    def test_multiple_formats_are_deduplicated(self):
+        """Repeated formats should be exported once, keeping their order."""
+        args = parse_arguments(["playlist123", "-f", "csv", "json", "csv"])
+        assert args.format == ["csv", "json"]
+
+
+class TestExportPlaylist:
+    """Tests for export_playlist."""
+
+    def test_exports_every_requested_format(self, tmp_path):
+        """export_playlist should write one file per format."""
+        playlist = Playlist(
+            name="My/Playlist",
+            description=None,
+            tracks=[Track(title="Song 1", artist="Artist 1", album="Album 1", duration=1000)],
+        )
+
+        file_names = export_playlist(playlist, ["json", "csv", "xml"], tmp_path)
+
+        assert file_names == [tmp_path / "MyPlaylist.json", tmp_path / "MyPlaylist.csv", tmp_path / "MyPlaylist.xml"]
+        assert all(file_name.exists() for file_name in file_names)
+
+    def test_no_formats_exports_nothing(self, tmp_path):
+        """export_playlist should return an empty list when no formats are given."""
+        playlist = Playlist(name="My Playlist", description=None, tracks=[])
+
+        assert export_playlist(playlist, [], tmp_path) == []
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,88 @@
+"""Tests for Playlist and Track models."""
+
+import pytest
+
+from spotify_playlist_exporter.models.playlist import Playlist, Track
+
+
+@pytest.fixture
+def sample_playlist():
+    """Fixture providing a sample playlist."""
+    return Playlist(
+        name="Test Playlist",
+        description=None,
+        tracks=[
+            Track(title="Song 1", artist="Artist 1", album="Album 1", duration=180000),
+            Track(title="Song 2", artist=None, album=None, duration=200000),
+        ],
+    )
+
+
+class TestTrack:
+    """Tests for Track."""
+
+    @pytest.mark.parametrize(
+        "duration,expected",
+        [(200000, 200000), (200000.0, 200000), ("200000", 200000), (None, 0)],
+        ids=["int", "float", "numeric_string", "missing"],
+    )
+    def test_duration_is_stored_as_int(self, duration, expected):
+        """Track should convert any numeric duration to an int."""
+        track = Track(title="Song", artist=None, album=None, duration=duration)
+
+        assert track.duration == expected
+
+    @pytest.mark.parametrize(
+        "duration",
+        ["3:20", [200000], float("inf"), 2 ** 63],
+        ids=["non_numeric_string", "list", "infinity", "above_int64"],
+    )
+    def test_invalid_duration_raises_error(self, duration):
+        """Track should reject a non-numeric duration with ValueError."""
+        with pytest.raises(ValueError, match="Invalid track duration"):
+            Track(title="Song", artist=None, album=None, duration=duration)
+
+
+class TestPlaylist:
+    """Tests for Playlist."""
+
+    def test_tracks_are_stored_column_wise(self, sample_playlist):
+        """Playlist should expose one column per track field."""
+        assert len(sample_playlist) == 2
+        assert sample_playlist.titles == ["Song 1", "Song 2"]
+        assert sample_playlist.artists == ["Artist 1", "Unknown Artist"]
+        assert sample_playlist.albums == ["Album 1", "Unknown Album"]
+        assert list(sample_playlist.durations) == [180000, 200000]
+
+    def test_tracks_are_rebuilt_from_columns(self, sample_playlist):
+        """Playlist.tracks should return equivalent Track objects."""
+        tracks = sample_playlist.tracks
+
+        assert all(isinstance(track, Track) for track in tracks)
+        assert [track.to_dict() for track in tracks] == sample_playlist.to_dict()["tracks"]
+
+    def test_add_track(self, sample_playlist):
+        """add_track should append to every column."""
+        sample_playlist.add_track(Track(title="Song 3", artist="A", album="B", duration=1000))
+
+        assert len(sample_playlist) == 3
+        assert list(sample_playlist.rows())[-1] == ("Song 3", "A", "B", 1000)
+
+    def test_repeated_artist_and_album_share_one_object(self):
+        """Equal artist and album names should be stored once."""
+        playlist = Playlist(
+            name="Test Playlist",
+            description=None,
+            tracks=[
+                Track(title=f"Song {i}", artist="".join(["Art", "ist"]), album="".join(["Alb", "um"]), duration=0)
+                for i in range(2)
+            ],
+        )
+
+        assert playlist.artists[0] is playlist.artists[1]
+        assert playlist.albums[0] is playlist.albums[1]
+
+    def test_empty_name_raises_error(self):
+        """Playlist should reject an empty name."""
+        with pytest.raises(ValueError, match="name cannot be empty"):
+            Playlist(name="", description=None, tracks=[])
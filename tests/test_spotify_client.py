@@ -1,264 +1,295 @@
 """Tests for SpotifyClient module."""
 
-import pytest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs
+
+import pytest
+import requests
 
 from spotify_playlist_exporter.models.playlist import Playlist, Track
+from spotify_playlist_exporter import spotify_client as spotify_client_module
 from spotify_playlist_exporter.spotify_client import (
+    RateLimiter,
     SpotifyAPIError,
     SpotifyAuthenticationError,
     SpotifyClient,
 )
 
+from .conftest import TOKEN_URL, TRACKS_URL
 
-@pytest.fixture
-def spotify_client():
-    """Create a SpotifyClient instance for testing."""
-    return SpotifyClient(client_id="test_id", client_secret="test_secret")
-
-
-class TestSpotifyClientInitialization:
-    """Tests for SpotifyClient initialization."""
-
-    def test_initialization_with_credentials(self, spotify_client):
-        """SpotifyClient should initialize with provided credentials."""
-        assert spotify_client.client_id == "test_id"
-        assert spotify_client.client_secret == "test_secret"
-        assert spotify_client.access_token is None
-
-    def test_initialization_without_explicit_credentials_requires_env_vars(self, monkeypatch):
-        """SpotifyClient should raise ValueError if no credentials are available."""
-        # Remove environment variables if they exist
-        monkeypatch.delenv("SPOTIFY_CLIENT_ID", raising=False)
-        monkeypatch.delenv("SPOTIFY_CLIENT_SECRET", raising=False)
-
-        with pytest.raises(ValueError, match="credentials"):
-            SpotifyClient()
-
-
-class TestSpotifyClientAuthentication:
-    """Tests for authentication functionality."""
-
-    @patch("spotify_playlist_exporter.spotify_client.requests.post")
-    def test_successful_authentication(self, mock_post, spotify_client):
-        """Authentication should succeed with valid credentials."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "access_token": "test_token_123",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-        }
-        mock_post.return_value = mock_response
-
-        result = spotify_client.authenticate()
-
-        assert result is True
-        assert spotify_client.access_token == "test_token_123"
-        mock_post.assert_called_once()
-
-    @patch("spotify_playlist_exporter.spotify_client.requests.post")
-    def test_authentication_with_invalid_credentials(self, mock_post):
-        """Authentication should raise SpotifyAuthenticationError with invalid credentials."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_post.return_value = mock_response
-
-        client = SpotifyClient(client_id="test_id", client_secret="test_secret")
-
-        with pytest.raises(SpotifyAuthenticationError, match="Invalid Spotify credentials"):
-            client.authenticate()
-
-    @patch("spotify_playlist_exporter.spotify_client.requests.post")
-    def test_authentication_with_network_error(self, mock_post):
-        """Authentication should raise SpotifyAuthenticationError on network errors."""
-        import requests
-        mock_post.side_effect = requests.exceptions.ConnectionError("Network error")
-
-        client = SpotifyClient(client_id="test_id", client_secret="test_secret")
-
-        with pytest.raises(SpotifyAuthenticationError, match="Network error"):
-            client.authenticate()
-
-
-class TestSpotifyClientPlaylistFetching:
-    """Tests for playlist fetching functionality."""
-
-    @patch("spotify_playlist_exporter.spotify_client.requests.get")
-    @patch("spotify_playlist_exporter.spotify_client.requests.post")
-    def test_get_playlist_success(self, mock_post, mock_get, spotify_client):
-        """get_playlist should return Playlist with correct data."""
-        auth_response = MagicMock()
-        auth_response.status_code = 200
-        auth_response.json.return_value = {"access_token": "test_token"}
-        mock_post.return_value = auth_response
-
-        playlist_response = MagicMock()
-        playlist_response.status_code = 200
-        playlist_response.json.return_value = {
-            "name": "My Playlist",
-            "description": "A great playlist",
-        }
-
-        tracks_response = MagicMock()
-        tracks_response.status_code = 200
-        tracks_response.json.return_value = {
-            "items": [
-                {
-                    "track": {
-                        "name": "Song 1",
-                        "artists": [{"name": "Artist 1"}],
-                        "album": {"name": "Album 1"},
-                        "duration_ms": 180000,
-                    }
-                }
-            ],
-            "next": None,
-        }
-
-        mock_get.side_effect = [playlist_response, tracks_response]
-
-        playlist = spotify_client.get_playlist("playlist123")
-
-        assert isinstance(playlist, Playlist)
-        assert playlist.name == "My Playlist"
-        assert playlist.description == "A great playlist"
-        assert len(playlist.tracks) == 1
-        assert playlist.tracks[0].title == "Song 1"
-
-    @patch("spotify_playlist_exporter.spotify_client.requests.get")
-    def test_get_playlist_not_found(self, mock_get):
-        """get_playlist should raise SpotifyAPIError when playlist not found."""
-        client = SpotifyClient(client_id="test_id", client_secret="test_secret")
-        client.access_token = "test_token"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
-
-        with pytest.raises(SpotifyAPIError, match="Playlist not found"):
-            client.get_playlist("nonexistent")
-
-    def test_get_playlist_with_invalid_id(self, spotify_client):
-        """get_playlist should raise ValueError with empty playlist ID."""
-        spotify_client.access_token = "test_token"
-
-        with pytest.raises(ValueError, match="Playlist ID"):
-            spotify_client.get_playlist("")
-
-
-class TestSpotifyClientTrackFetching:
-    """Tests for track fetching functionality."""
-
-    @patch("spotify_playlist_exporter.spotify_client.requests.get")
-    def test_get_tracks_success(self, mock_get):
-        """get_tracks should return list of Track objects."""
-        client = SpotifyClient(client_id="test_id", client_secret="test_secret")
-        client.access_token = "test_token"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [
-                {
-                    "track": {
-                        "name": "Track 1",
-                        "artists": [{"name": "Artist 1"}],
-                        "album": {"name": "Album 1"},
-                        "duration_ms": 200000,
-                    }
-                },
-                {
-                    "track": {
-                        "name": "Track 2",
-                        "artists": [{"name": "Artist 2"}],
-                        "album": {"name": "Album 2"},
-                        "duration_ms": 250000,
-                    }
-                },
-            ],
-            "next": None,
-        }
-        mock_get.return_value = mock_response
-
-        tracks = client.get_tracks("playlist123")
-
-        assert len(tracks) == 2
-        assert all(isinstance(track, Track) for track in tracks)
-        assert tracks[0].title == "Track 1"
-        assert tracks[1].artist == "Artist 2"
-
-    @patch("spotify_playlist_exporter.spotify_client.requests.get")
-    def test_get_tracks_with_pagination(self, mock_get):
-        """get_tracks should handle paginated responses."""
-        client = SpotifyClient(client_id="test_id", client_secret="test_secret")
-        client.access_token = "test_token"
-
-        first_response = MagicMock()
-        first_response.status_code = 200
-        first_response.json.return_value = {
-            "items": [
-                {
-                    "track": {
-                        "name": "Track 1",
-                        "artists": [{"name": "Artist 1"}],
-                        "album": {"name": "Album 1"},
-                        "duration_ms": 200000,
-                    }
-                }
-            ],
-            "next": "https://api.spotify.com/v1/playlists/123/tracks?offset=1",
-        }
-
-        second_response = MagicMock()
-        second_response.status_code = 200
-        second_response.json.return_value = {
-            "items": [
-                {
-                    "track": {
-                        "name": "Track 2",
-                        "artists": [{"name": "Artist 2"}],
-                        "album": {"name": "Album 2"},
-                        "duration_ms": 250000,
-                    }
+pytestmark = pytest.mark.mocked
+
+
+def make_track_page(start, count, next_url=None, total=None):
+    """Build a tracks page payload with tracks numbered from start + 1."""
+    page = {
+        "items": [
+            {
+                "track": {
+                    "name": f"Track {i}",
+                    "artists": [{"name": f"Artist {i}"}],
+                    "album": {"name": f"Album {i}"},
+                    "duration_ms": 200000,
                 }
-            ],
-            "next": None,
-        }
-
-        mock_get.side_effect = [first_response, second_response]
-
-        tracks = client.get_tracks("playlist123")
-
-        assert len(tracks) == 2
-        assert mock_get.call_count == 2
-
-    @patch("spotify_playlist_exporter.spotify_client.requests.get")
-    def test_get_tracks_with_invalid_data(self, mock_get):
-        """get_tracks should skip invalid track data."""
-        client = SpotifyClient(client_id="test_id", client_secret="test_secret")
-        client.access_token = "test_token"
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [
-                {
-                    "track": {
-                        "name": "Valid Track",
-                        "artists": [{"name": "Artist"}],
-                        "album": {"name": "Album"},
-                        "duration_ms": 200000,
-                    }
-                },
-                {"track": None},  # Invalid track
-            ],
-            "next": None,
-        }
-        mock_get.return_value = mock_response
-
-        tracks = client.get_tracks("playlist123")
-
-        # Should only include the valid track
-        assert len(tracks) == 1
-        assert tracks[0].title == "Valid Track"
\ No newline at end of file
+            }
+            for i in range(start + 1, start + count + 1)
+        ],
+        "next": next_url,
+    }
+    if total is not None:
+        page["total"] = total
+    return page
+
+
+# Response payloads are built once at import time and shared read-only;
+# requests-mock serializes them afresh for every request.
+TWO_TRACK_PAGE = make_track_page(0, 2)
+FULL_TRACK_PAGE = make_track_page(0, 100)
+LINKED_TRACK_PAGES = [
+    make_track_page(0, 100, next_url=f"{TRACKS_URL}?offset=100&limit=100"),
+    make_track_page(100, 100, next_url=f"{TRACKS_URL}?offset=200&limit=100"),
+    make_track_page(200, 50),
+]
+TRACK_PAGES_BY_OFFSET = {
+    offset: make_track_page(offset, min(100, 250 - offset), total=250)
+    for offset in (0, 100, 200)
+}
+TRACK_PAGE_WITH_INVALID = {
+    "items": [
+        {
+            "track": {
+                "name": "Valid Track",
+                "artists": [{"name": "Artist"}],
+                "album": {"name": "Album"},
+                "duration_ms": 200000,
+            }
+        },
+        {"track": None},  # Invalid track
+    ],
+    "next": None,
+}
+
+
+# Initialization
+
+
+def test_initialization_with_credentials(spotify_client):
+    """SpotifyClient should initialize with provided credentials."""
+    assert spotify_client.client_id == "test_id"
+    assert spotify_client.client_secret == "test_secret"
+    assert spotify_client.access_token is None
+
+
+def test_initialization_without_explicit_credentials_requires_env_vars(monkeypatch):
+    """SpotifyClient should raise ValueError if no credentials are available."""
+    # Remove environment variables if they exist
+    monkeypatch.delenv("SPOTIFY_CLIENT_ID", raising=False)
+    monkeypatch.delenv("SPOTIFY_CLIENT_SECRET", raising=False)
+
+    with pytest.raises(ValueError) as excinfo:
+        SpotifyClient()
+    assert "credentials" in str(excinfo.value)
+
+
+# Authentication
+
+
+def test_authentication_success(spotify_api, spotify_client):
+    """Authentication should succeed with valid credentials."""
+    result = spotify_client.authenticate()
+
+    assert result is True
+    assert spotify_client.access_token == "test_token"
+    assert spotify_api.call_count == 1
+    assert parse_qs(spotify_api.last_request.text)["grant_type"] == ["client_credentials"]
+
+
+@pytest.mark.parametrize(
+    "response,message",
+    [
+        ({"status_code": 401}, "Invalid Spotify credentials"),
+        ({"status_code": 500}, "Authentication failed: 500"),
+        ({"exc": requests.exceptions.ConnectionError("Network error")}, "Network error"),
+    ],
+    ids=["invalid_credentials", "server_error", "network_error"],
+)
+def test_authentication_errors(spotify_api, spotify_client, response, message):
+    """Authentication failures should raise SpotifyAuthenticationError."""
+    spotify_api.post(TOKEN_URL, **response)
+
+    with pytest.raises(SpotifyAuthenticationError) as excinfo:
+        spotify_client.authenticate()
+    assert message in str(excinfo.value)
+
+
+# Playlist fetching
+
+
+def test_get_playlist_success(spotify_api, authenticated_client):
+    """get_playlist should return Playlist with correct data."""
+    playlist = authenticated_client.get_playlist("playlist123")
+
+    assert isinstance(playlist, Playlist)
+    assert playlist.name == "My Playlist"
+    assert playlist.description == "A great playlist"
+    assert len(playlist.tracks) == 2
+    assert playlist.tracks[0].title == "Track 1"
+
+
+def test_get_playlist_authenticates_when_needed(spotify_api, spotify_client):
+    """get_playlist should authenticate first if the client has no token."""
+    spotify_client.get_playlist("playlist123")
+
+    assert spotify_client.access_token == "test_token"
+    assert spotify_api.request_history[0].url == TOKEN_URL
+
+
+def test_get_playlist_is_cached(spotify_api, authenticated_client):
+    """Repeated get_playlist calls for one ID should hit the API once."""
+    first = authenticated_client.get_playlist("playlist123")
+    second = authenticated_client.get_playlist("playlist123")
+
+    assert second is first
+    assert spotify_api.call_count == 2  # playlist + tracks, fetched once
+
+
+def test_get_playlist_clear_cache_forces_refetch(spotify_api, authenticated_client):
+    """clear_cache should make the next get_playlist call refetch."""
+    authenticated_client.get_playlist("playlist123")
+    authenticated_client.clear_cache()
+    authenticated_client.get_playlist("playlist123")
+
+    assert spotify_api.call_count == 4
+
+
+def test_get_playlist_not_found(spotify_api, authenticated_client):
+    """get_playlist should raise SpotifyAPIError when playlist not found."""
+    spotify_api.get("https://api.spotify.com/v1/playlists/nonexistent", status_code=404)
+
+    with pytest.raises(SpotifyAPIError) as excinfo:
+        authenticated_client.get_playlist("nonexistent")
+    assert "Playlist not found" in str(excinfo.value)
+
+
+def test_get_playlist_with_invalid_id(authenticated_client):
+    """get_playlist should raise ValueError with empty playlist ID."""
+    with pytest.raises(ValueError) as excinfo:
+        authenticated_client.get_playlist("")
+    assert "Playlist ID" in str(excinfo.value)
+
+
+# Track fetching
+
+
+@pytest.mark.parametrize(
+    "pages,expected_titles,calls",
+    [
+        ([TWO_TRACK_PAGE], ["Track 1", "Track 2"], 1),
+        ([FULL_TRACK_PAGE], [f"Track {i}" for i in range(1, 101)], 1),
+        (LINKED_TRACK_PAGES, [f"Track {i}" for i in range(1, 251)], 3),
+        ([TRACK_PAGE_WITH_INVALID], ["Valid Track"], 1),
+    ],
+    ids=["single_page", "full_page", "linked_pages", "invalid_track_skipped"],
+)
+def test_get_tracks(spotify_api, authenticated_client, pages, expected_titles, calls):
+    """get_tracks should return the valid tracks from every page, in order."""
+    spotify_api.get(TRACKS_URL, [{"json": page} for page in pages])
+
+    tracks = authenticated_client.get_tracks("playlist123")
+
+    assert all(isinstance(track, Track) for track in tracks)
+    assert [track.title for track in tracks] == expected_titles
+    assert spotify_api.call_count == calls
+
+
+def test_get_tracks_query_parameters(spotify_api, authenticated_client):
+    """get_tracks should request full pages with only the needed fields."""
+    tracks = authenticated_client.get_tracks("playlist123")
+
+    assert tracks[1].artist == "Artist 2"
+    assert spotify_api.last_request.qs["limit"] == ["100"]
+    assert "fields" in spotify_api.last_request.qs
+
+
+def test_get_tracks_fetches_pages_concurrently_by_offset(spotify_api, authenticated_client):
+    """get_tracks should request every page by offset when the total is known."""
+    spotify_api.get(TRACKS_URL, json=TRACK_PAGES_BY_OFFSET[0])
+    spotify_api.get(f"{TRACKS_URL}?offset=100", json=TRACK_PAGES_BY_OFFSET[100])
+    spotify_api.get(f"{TRACKS_URL}?offset=200", json=TRACK_PAGES_BY_OFFSET[200])
+
+    with patch.object(spotify_client_module, "ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor:
+        tracks = authenticated_client.get_tracks("playlist123")
+
+    assert executor.call_count == 1
+    assert spotify_api.call_count == 3
+    assert sorted(request.qs["offset"][0] for request in spotify_api.request_history) == ["0", "100", "200"]
+    assert [track.title for track in tracks] == [f"Track {i}" for i in range(1, 251)]
+
+
+def test_get_tracks_concurrent_page_failure(spotify_api, authenticated_client):
+    """A failing page fetched concurrently should raise SpotifyAPIError."""
+    spotify_api.get(TRACKS_URL, json=make_track_page(0, 100, total=200))
+    spotify_api.get(f"{TRACKS_URL}?offset=100", status_code=500)
+
+    with pytest.raises(SpotifyAPIError) as excinfo:
+        authenticated_client.get_tracks("playlist123")
+    assert "Failed to fetch tracks: 500" in str(excinfo.value)
+
+
+class TestRateLimiter:
+    """Tests for the request rate limiter."""
+
+    @pytest.fixture
+    def fake_clock(self):
+        """Clock for injection into RateLimiter that advances only by sleeping."""
+        clock = SimpleNamespace(now=1000.0, sleeps=[])
+
+        def sleep(seconds):
+            clock.sleeps.append(seconds)
+            clock.now += seconds
+
+        clock.monotonic = lambda: clock.now
+        clock.sleep = sleep
+        return clock
+
+    def test_burst_then_throttle(self, fake_clock):
+        """The first `capacity` requests should not wait; the rest should be spaced out."""
+        limiter = RateLimiter(rate=10, capacity=10, clock=fake_clock.monotonic, sleep=fake_clock.sleep)
+        sleeps_per_call = []
+
+        for _ in range(20):
+            before = len(fake_clock.sleeps)
+            limiter.acquire()
+            sleeps_per_call.append(len(fake_clock.sleeps) - before)
+
+        assert sleeps_per_call[:10] == [0] * 10
+        assert sleeps_per_call[10:] == [1] * 10
+        assert sum(fake_clock.sleeps) == pytest.approx(1.0)
+
+    def test_tokens_refill_over_time(self, fake_clock):
+        """Idle time should refill the bucket up to its capacity."""
+        limiter = RateLimiter(rate=10, capacity=10, clock=fake_clock.monotonic, sleep=fake_clock.sleep)
+        for _ in range(10):
+            limiter.acquire()
+
+        fake_clock.now += 5.0
+        for _ in range(10):
+            limiter.acquire()
+
+        assert fake_clock.sleeps == []
+
+    def test_invalid_configuration_raises_error(self):
+        """RateLimiter should reject a non-positive rate or capacity."""
+        with pytest.raises(ValueError) as excinfo:
+            RateLimiter(rate=0)
+        assert "must be positive" in str(excinfo.value)
+
+    def test_client_requests_are_rate_limited(self, spotify_api, authenticated_client):
+        """SpotifyClient should take a token before each API request."""
+        authenticated_client.rate_limiter = MagicMock(spec_set=RateLimiter)
+
+        authenticated_client.get_tracks("playlist123")
+
+        assert authenticated_client.rate_limiter.acquire.call_count == 1